@@ -13,14 +13,14 @@ from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
-    from collections.abc import Sequence
+    from collections.abc import Iterable, Sequence
 
 # Module-level constants
 DEFAULT_VALUE = 42
 MAX_RETRIES = 3
 
 
-@dataclass
+@dataclass(slots=True)
 class MyClass:
     """Brief one-line description of the class.
 
@@ -44,9 +44,12 @@ class MyClass:
     _cache: dict[str, Any] = field(default_factory=dict, init=False, repr=False)
 
     def __post_init__(self) -> None:
-        """Validate and normalize after initialization."""
+        """Normalize and validate after initialization."""
+        if isinstance(self.name, str):
+            name = self.name.strip()
+            if name is not self.name:
+                self.name = name
         self._validate()
-        self.name = self.name.strip()
 
     def _validate(self) -> None:
         """Validate instance state."""
@@ -97,4 +100,27 @@ class MyClass:
             name=data["name"],
             value=data.get("value", DEFAULT_VALUE),
             is_active=data.get("is_active", True),
-        )
\ No newline at end of file
+        )
+
+
+def from_dict_many(rows: Iterable[dict[str, Any]]) -> list[MyClass]:
+    """Create instances from many dictionaries.
+
+    Equivalent to calling ``MyClass.from_dict`` per row, with the class
+    and default bound to locals once instead of looked up per row.
+
+    Args:
+        rows: Dictionaries containing instance data.
+
+    Returns:
+        New instances, in input order.
+
+    Raises:
+        KeyError: If a row is missing required keys.
+    """
+    build = MyClass
+    default = DEFAULT_VALUE
+    return [
+        build(row["name"], row.get("value", default), row.get("is_active", True))
+        for row in rows
+    ]
@@ -5,26 +5,34 @@ This script provides a CLI for [description of what it does].
 
 Usage:
     python cli_script.py --input data.json --output results.json
+    python cli_script.py --input-dir data/ --output results.json
     python cli_script.py -v process --file input.txt
 
 Example:
     $ python cli_script.py --help
     $ python cli_script.py process --input data.json
+
+If the optional ``orjson`` package is installed it is used for reading
+and writing JSON; otherwise the standard library ``json`` module is used.
+Output that orjson cannot encode falls back to ``json``. Both paths read
+and write UTF-8 and leave non-ASCII characters unescaped, so output does
+not depend on which one is used. The orjson path otherwise differs from ``json`` in a few ways: it writes ``NaN`` and
+``Infinity`` as ``null``, rejects them when reading, and parses integers
+beyond 64 bits as floats.
 """
 from __future__ import annotations
 
 import argparse
-import json
+import functools
 import logging
 import sys
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator, Sequence
+    from types import ModuleType
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-)
 logger = logging.getLogger(__name__)
 
 
@@ -47,9 +55,41 @@ def setup_logging(verbose: bool) -> None:
         verbose: If True, set logging to DEBUG level.
     """
     level = logging.DEBUG if verbose else logging.INFO
+    logging.basicConfig(
+        level=level,
+        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+    )
     logging.getLogger().setLevel(level)
 
 
+@functools.cache
+def _orjson() -> ModuleType | None:
+    """Import orjson on first use, returning None if it is unavailable."""
+    try:
+        import orjson
+    except ImportError:
+        return None
+    return orjson
+
+
+def _orjson_dumps(data: dict[str, Any]) -> bytes | None:
+    """Encode data as indented JSON with orjson.
+
+    Returns:
+        Encoded bytes, or None if orjson is unavailable or cannot encode
+        the data (for example integers beyond 64 bits).
+    """
+    orjson = _orjson()
+    if orjson is None:
+        return None
+    try:
+        return orjson.dumps(
+            data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+        )
+    except TypeError:
+        return None
+
+
 def load_json_file(path: Path) -> dict[str, Any]:
     """Load and parse a JSON file.
 
@@ -62,8 +102,13 @@ def load_json_file(path: Path) -> dict[str, Any]:
     Raises:
         InputError: If file cannot be read or parsed.
     """
+    import json
+
+    orjson = _orjson()
     try:
-        with path.open() as f:
+        if orjson is not None:
+            return orjson.loads(path.read_bytes())
+        with path.open(encoding="utf-8") as f:
             return json.load(f)
     except FileNotFoundError:
         raise InputError(f"File not found: {path}")
@@ -71,6 +116,82 @@ def load_json_file(path: Path) -> dict[str, Any]:
         raise InputError(f"Invalid JSON in {path}: {e}")
 
 
+def load_json_files(paths: Iterable[Path]) -> Iterator[dict[str, Any]]:
+    """Load JSON files one at a time.
+
+    Args:
+        paths: Paths to the JSON files.
+
+    Yields:
+        Parsed JSON data for each path, in order.
+
+    Raises:
+        InputError: If a file cannot be read or parsed.
+    """
+    load = load_json_file
+    for path in paths:
+        yield load(path)
+
+
+def load_json_files_bulk(
+    paths: Sequence[Path], max_workers: int = 8
+) -> list[dict[str, Any]]:
+    """Load many JSON files concurrently.
+
+    Reads are overlapped on a thread pool and submitted in inode order,
+    which tends to follow on-disk layout for files in one directory.
+
+    Args:
+        paths: Paths to the JSON files.
+        max_workers: Maximum number of concurrent reads.
+
+    Returns:
+        Parsed JSON data, in the same order as ``paths``.
+
+    Raises:
+        InputError: If any file cannot be read or parsed.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    order = sorted(range(len(paths)), key=lambda i: _inode(paths[i]))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        loaded = executor.map(load_json_file, [paths[i] for i in order])
+        by_index = dict(zip(order, loaded))
+    return [by_index[i] for i in range(len(paths))]
+
+
+def _inode(path: Path) -> int:
+    """Return the inode number of path, or 0 if it cannot be stat'ed."""
+    try:
+        return path.stat().st_ino
+    except OSError:
+        return 0
+
+
+def load_input(args: argparse.Namespace) -> dict[str, Any]:
+    """Load the input selected on the command line.
+
+    Args:
+        args: Parsed command-line arguments.
+
+    Returns:
+        Parsed JSON data. For ``--input-dir`` this maps each file name
+        to its parsed contents.
+
+    Raises:
+        InputError: If the input cannot be read or parsed.
+    """
+    if args.input is not None:
+        logger.info("Loading input from %s", args.input)
+        return load_json_file(args.input)
+
+    if not args.input_dir.is_dir():
+        raise InputError(f"Directory not found: {args.input_dir}")
+    paths = sorted(p for p in args.input_dir.glob("*.json") if p.is_file())
+    logger.info("Loading %d files from %s", len(paths), args.input_dir)
+    return dict(zip((p.name for p in paths), load_json_files_bulk(paths)))
+
+
 def save_json_file(path: Path, data: dict[str, Any]) -> None:
     """Save data to a JSON file.
 
@@ -78,11 +199,45 @@ def save_json_file(path: Path, data: dict[str, Any]) -> None:
         path: Output file path.
         data: Data to save.
     """
-    with path.open("w") as f:
-        json.dump(data, f, indent=2)
+    encoded = _orjson_dumps(data)
+    if encoded is not None:
+        path.write_bytes(encoded)
+    else:
+        import json
+
+        with path.open("w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2, ensure_ascii=False)
     logger.info("Saved output to %s", path)
 
 
+def write_json_stdout(data: dict[str, Any]) -> None:
+    """Write data to stdout as indented JSON.
+
+    The standard library path streams into stdout instead of building the
+    whole string; the orjson path writes bytes to the underlying buffer
+    when stdout has one (it does not when redirected to a text stream).
+
+    Args:
+        data: Data to write.
+    """
+    encoded = _orjson_dumps(data)
+    if encoded is not None:
+        buffer = getattr(sys.stdout, "buffer", None)
+        if buffer is None:
+            sys.stdout.write(encoded.decode())
+            sys.stdout.write("\n")
+            return
+        sys.stdout.flush()
+        buffer.write(encoded)
+        buffer.write(b"\n")
+        return
+
+    import json
+
+    json.dump(data, sys.stdout, indent=2, ensure_ascii=False)
+    sys.stdout.write("\n")
+
+
 def process_data(data: dict[str, Any]) -> dict[str, Any]:
     """Process the input data.
 
@@ -93,17 +248,19 @@ def process_data(data: dict[str, Any]) -> dict[str, Any]:
         Processed data.
     """
     # Implement your processing logic here
-    result = {
+    return {
         "status": "processed",
-        "input_keys": list(data.keys()),
+        "input_keys": list(data),
         "item_count": len(data),
     }
-    return result
 
 
+@functools.cache
 def create_parser() -> argparse.ArgumentParser:
     """Create and configure the argument parser.
 
+    The parser is built once and reused by later calls.
+
     Returns:
         Configured ArgumentParser instance.
     """
@@ -115,6 +272,7 @@ Examples:
   %(prog)s --input data.json --output results.json
   %(prog)s -v --input data.json
   %(prog)s --dry-run --input data.json
+  %(prog)s --input-dir data/ --output results.json
         """,
     )
 
@@ -131,12 +289,17 @@ Examples:
     )
 
     # Input/output options
-    parser.add_argument(
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument(
         "-i", "--input",
         type=Path,
-        required=True,
         help="Input JSON file path",
     )
+    source.add_argument(
+        "--input-dir",
+        type=Path,
+        help="Directory of input JSON files",
+    )
     parser.add_argument(
         "-o", "--output",
         type=Path,
@@ -168,12 +331,12 @@ def main(argv: list[str] | None = None) -> int:
     args = parser.parse_args(argv)
 
     setup_logging(args.verbose)
-    logger.debug("Arguments: %s", args)
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Arguments: %s", args)
 
     try:
         # Load input
-        logger.info("Loading input from %s", args.input)
-        data = load_json_file(args.input)
+        data = load_input(args)
 
         # Process data
         if args.dry_run:
@@ -186,7 +349,7 @@ def main(argv: list[str] | None = None) -> int:
         if args.output:
             save_json_file(args.output, result)
         else:
-            print(json.dumps(result, indent=2))
+            write_json_stdout(result)
 
         return 0
 
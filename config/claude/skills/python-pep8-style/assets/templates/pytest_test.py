@@ -10,27 +10,39 @@ from unittest.mock import Mock, patch
 import pytest
 
 # Import the module under test
-# from myapp.services import UserService, UserNotFoundError
+# from myapp.services import NotificationError, UserNotFoundError, UserService
 
 
 class TestUserService:
     """Tests for UserService class."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def mock_repository(self):
-        """Create a mock repository."""
-        repo = Mock()
-        repo.get.return_value = {"id": 1, "name": "Test User", "email": "test@example.com"}
-        repo.save.return_value = 1
-        repo.delete.return_value = True
-        return repo
+        """Create a mock repository shared by the tests in a class.
 
-    @pytest.fixture
+        The spec keeps the mock from also looking like a BatchRepository.
+        """
+        return Mock(spec=["get", "save", "delete"])
+
+    @pytest.fixture(scope="class")
     def mock_notifier(self):
-        """Create a mock notification service."""
-        notifier = Mock()
-        notifier.send.return_value = True
-        return notifier
+        """Create a mock notification service shared by the tests in a class."""
+        return Mock()
+
+    @pytest.fixture(autouse=True)
+    def _reset_mocks(self, mock_repository, mock_notifier):
+        """Reset shared mocks and restore their default return values."""
+        mock_repository.reset_mock(return_value=True, side_effect=True)
+        mock_repository.get.return_value = {
+            "id": 1,
+            "name": "Test User",
+            "email": "test@example.com",
+        }
+        mock_repository.save.return_value = 1
+        mock_repository.delete.return_value = True
+
+        mock_notifier.reset_mock(return_value=True, side_effect=True)
+        mock_notifier.send.return_value = True
 
     @pytest.fixture
     def service(self, mock_repository, mock_notifier):
@@ -126,6 +138,89 @@ class TestUserService:
             # assert call_args.kwargs["recipient"] == "new@example.com"
             pass
 
+        def test_reports_created_user_when_notifier_fails(
+            self, service, mock_repository, mock_notifier
+        ):
+            """Should raise NotificationError carrying the new user's ID."""
+            # Arrange
+            user_data = {"name": "New User", "email": "new@example.com"}
+            mock_repository.save.return_value = 42
+            mock_notifier.send.side_effect = RuntimeError("notifier bug")
+
+            # Act & Assert
+            # with pytest.raises(NotificationError) as exc_info:
+            #     service.create_user(user_data)
+            # assert exc_info.value.user_ids == [42]
+            pass
+
+    class TestCreateUsers:
+        """Tests for create_users method."""
+
+        @pytest.fixture
+        def batch_repository(self):
+            """Create a mock repository that supports save_many."""
+            repo = Mock(spec=["get", "save", "delete", "save_many"])
+            repo.save_many.return_value = [1, 2, 3]
+            return repo
+
+        def test_uses_save_many_when_supported(
+            self, batch_repository, mock_notifier, sample_users
+        ):
+            """Should save the batch in one call when save_many exists."""
+            # Arrange
+            # service = UserService(batch_repository, mock_notifier)
+
+            # Act
+            # result = service.create_users(sample_users)
+
+            # Assert
+            # assert result == [1, 2, 3]
+            # batch_repository.save_many.assert_called_once_with(sample_users)
+            # batch_repository.save.assert_not_called()
+            pass
+
+        def test_falls_back_to_save_per_user(
+            self, service, mock_repository, sample_users
+        ):
+            """Should call save once per user when save_many is missing."""
+            # Arrange
+            mock_repository.save.side_effect = [1, 2, 3]
+
+            # Act
+            # result = service.create_users(sample_users)
+
+            # Assert
+            # assert result == [1, 2, 3]
+            # assert mock_repository.save.call_count == 3
+            pass
+
+        def test_reports_failed_notifications_after_sending_all(
+            self, service, mock_repository, mock_notifier, sample_users
+        ):
+            """Should try every notification, then raise with failed IDs."""
+            # Arrange
+            mock_repository.save.side_effect = [1, 2, 3]
+            mock_notifier.send.side_effect = [RuntimeError("bug"), True, True]
+
+            # Act & Assert
+            # with pytest.raises(NotificationError) as exc_info:
+            #     service.create_users(sample_users)
+            # assert exc_info.value.user_ids == [1, 2, 3]
+            # assert exc_info.value.failed_ids == [1]
+            # assert mock_notifier.send.call_count == 3
+            pass
+
+        def test_saves_nothing_when_any_user_is_invalid(
+            self, service, mock_repository, sample_users
+        ):
+            """Should validate every user before saving any of them."""
+            # users = [*sample_users, {"name": "No Email"}]
+
+            # with pytest.raises(ValueError, match="Email is required"):
+            #     service.create_users(users)
+            # mock_repository.save.assert_not_called()
+            pass
+
 
 class TestUserModel:
     """Tests for User model/dataclass."""
@@ -159,8 +254,9 @@ class TestUserModel:
 
 # Fixtures that might be shared across test files
 # Move to conftest.py if needed
+# Module-scoped: built once, so tests must not mutate them
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_user_data():
     """Sample user data for testing."""
     return {
@@ -171,7 +267,7 @@ def sample_user_data():
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_users():
     """List of sample users for testing."""
     return [
@@ -5,31 +5,51 @@ and coordinate between different layers of the application.
 """
 from __future__ import annotations
 
+import functools
 import logging
+import re
+import weakref
 from dataclasses import dataclass
-from typing import TYPE_CHECKING, Protocol
+from typing import TYPE_CHECKING, Protocol, runtime_checkable
 
 if TYPE_CHECKING:
     from collections.abc import Sequence
 
 logger = logging.getLogger(__name__)
 
+_EMAIL_MATCH = re.compile(r"[^@\s]+@[^@\s]+\.[^@\s]+").fullmatch
+
 
 class Repository(Protocol):
-    """Protocol for data repository implementations."""
+    """Protocol for data repository implementations.
+
+    ``delete`` returns False when no record with the given ID exists.
+    """
 
     def get(self, id: int) -> dict | None: ...
     def save(self, data: dict) -> int: ...
     def delete(self, id: int) -> bool: ...
 
 
+@runtime_checkable
+class BatchRepository(Repository, Protocol):
+    """Protocol for repositories that can save many records at once.
+
+    Detected with ``isinstance``, which only checks that the methods
+    exist; a ``Mock`` repository needs a ``spec`` so it is not mistaken
+    for a batch repository.
+    """
+
+    def save_many(self, data: Sequence[dict]) -> list[int]: ...
+
+
 class NotificationService(Protocol):
     """Protocol for notification service implementations."""
 
     def send(self, recipient: str, message: str) -> bool: ...
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ServiceConfig:
     """Configuration for the service."""
 
@@ -38,6 +58,28 @@ class ServiceConfig:
     enable_notifications: bool = True
 
 
+@functools.lru_cache(maxsize=4096)
+def _user_data_error(name: str | None, email: str | None) -> str | None:
+    """Return the validation error for a name and email, or None if valid.
+
+    Results are cached on ``(name, email)`` because bulk imports tend to
+    validate the same values repeatedly.
+    """
+    if not name:
+        return "Name is required"
+    if not email:
+        return "Email is required"
+    if not _EMAIL_MATCH(email):
+        return "Invalid email format"
+    return None
+
+
+class _CachedUser(dict):
+    """User data dictionary that can be held in a weak-value cache."""
+
+    __slots__ = ("__weakref__",)
+
+
 class UserServiceError(Exception):
     """Base exception for UserService errors."""
 
@@ -52,6 +94,23 @@ class UserNotFoundError(UserServiceError):
         super().__init__(f"User {user_id} not found")
 
 
+class NotificationError(UserServiceError):
+    """Raised when users were created but notifying some of them failed.
+
+    Attributes:
+        user_ids: IDs of every user created by the call.
+        failed_ids: IDs of the users whose notification failed.
+    """
+
+    def __init__(self, user_ids: list[int], failed_ids: list[int]) -> None:
+        self.user_ids = user_ids
+        self.failed_ids = failed_ids
+        super().__init__(
+            f"Users {failed_ids} were created but their welcome "
+            "notification failed"
+        )
+
+
 class UserService:
     """Service for user-related business operations.
 
@@ -86,10 +145,18 @@ class UserService:
         self.repository = repository
         self.notifier = notifier
         self.config = config or ServiceConfig()
+        self._welcome_message = "Welcome, {}!".format
+        self._user_cache: weakref.WeakValueDictionary[int, _CachedUser] = (
+            weakref.WeakValueDictionary()
+        )
 
     def get_user(self, user_id: int) -> dict:
         """Get user by ID.
 
+        Users still referenced elsewhere are served from a weak-value cache
+        instead of the repository. The returned dictionary may be shared
+        with other callers and should not be mutated.
+
         Args:
             user_id: The user's unique identifier.
 
@@ -99,10 +166,15 @@ class UserService:
         Raises:
             UserNotFoundError: If user does not exist.
         """
+        user = self._user_cache.get(user_id)
+        if user is not None:
+            return user
+
         logger.debug("Fetching user %d", user_id)
-        user = self.repository.get(user_id)
-        if user is None:
+        data = self.repository.get(user_id)
+        if data is None:
             raise UserNotFoundError(user_id)
+        user = self._user_cache[user_id] = _CachedUser(data)
         return user
 
     def create_user(self, user_data: dict) -> int:
@@ -116,16 +188,76 @@ class UserService:
 
         Raises:
             ValueError: If user data is invalid.
+            NotificationError: If the user was saved but the notifier failed
+                with an error other than a transport error. The error
+                carries the new user's ID in ``user_ids``.
         """
         self._validate_user_data(user_data)
         user_id = self.repository.save(user_data)
         logger.info("Created user %d", user_id)
 
         if self.config.enable_notifications and self.notifier:
-            self._send_welcome_notification(user_data)
+            try:
+                self._send_welcome_notification(user_data)
+            except Exception as e:
+                raise NotificationError([user_id], [user_id]) from e
 
         return user_id
 
+    def create_users(self, users: Sequence[dict]) -> list[int]:
+        """Create several users at once.
+
+        Every record is validated before any is saved. Repositories that
+        implement ``save_many`` save the whole batch in one call; welcome
+        notifications are sent once the batch has been saved. A failed
+        notification does not stop the others; failures are reported
+        together once every notification has been attempted.
+
+        Args:
+            users: Dictionaries containing user data.
+
+        Returns:
+            IDs of the created users, in input order.
+
+        Raises:
+            ValueError: If any user data is invalid.
+            UserServiceError: If ``save_many`` returns a different number
+                of IDs than users passed in.
+            NotificationError: If the users were saved but the notifier
+                failed for some of them with an error other than a
+                transport error. The error carries all created IDs in
+                ``user_ids`` and the affected ones in ``failed_ids``.
+        """
+        for user_data in users:
+            self._validate_user_data(user_data)
+
+        if isinstance(self.repository, BatchRepository):
+            user_ids = self.repository.save_many(users)
+            if len(user_ids) != len(users):
+                raise UserServiceError(
+                    f"save_many returned {len(user_ids)} IDs "
+                    f"for {len(users)} users"
+                )
+        else:
+            save = self.repository.save
+            user_ids = [save(user_data) for user_data in users]
+        logger.info("Created %d users", len(user_ids))
+
+        if self.config.enable_notifications and self.notifier:
+            failed_ids: list[int] = []
+            first_error: Exception | None = None
+            for user_id, user_data in zip(user_ids, users):
+                try:
+                    self._send_welcome_notification(user_data)
+                except Exception as e:
+                    # Collected and re-raised below as NotificationError
+                    failed_ids.append(user_id)
+                    first_error = first_error or e
+            if failed_ids:
+                raise NotificationError(user_ids, failed_ids) from first_error
+
+        return user_ids
+
     def delete_user(self, user_id: int) -> None:
         """Delete a user.
 
@@ -135,12 +267,10 @@ class UserService:
         Raises:
             UserNotFoundError: If user does not exist.
         """
-        # Verify user exists
-        self.get_user(user_id)
-
-        success = self.repository.delete(user_id)
-        if success:
-            logger.info("Deleted user %d", user_id)
+        self._user_cache.pop(user_id, None)
+        if not self.repository.delete(user_id):
+            raise UserNotFoundError(user_id)
+        logger.info("Deleted user %d", user_id)
 
     def _validate_user_data(self, data: dict) -> None:
         """Validate user data.
@@ -151,27 +281,31 @@ class UserService:
         Raises:
             ValueError: If data is invalid.
         """
-        if not data.get("name"):
-            raise ValueError("Name is required")
-        if not data.get("email"):
-            raise ValueError("Email is required")
-        if "@" not in data["email"]:
-            raise ValueError("Invalid email format")
+        try:
+            error = _user_data_error(data.get("name"), data.get("email"))
+        except TypeError as e:
+            # Unhashable values cannot go through the lru_cache
+            raise ValueError(f"Invalid name or email: {e}") from e
+        if error is not None:
+            raise ValueError(error)
 
     def _send_welcome_notification(self, user_data: dict) -> None:
         """Send welcome notification to new user.
 
+        Only called when notifications are enabled and a notifier is set.
+        Transport errors are logged; any other error propagates.
+
         Args:
             user_data: New user's data.
         """
-        if self.notifier is None:
-            return
-
+        # Type-checker hint only (stripped under -O); callers check notifier
+        assert self.notifier is not None
         try:
             self.notifier.send(
                 recipient=user_data["email"],
-                message=f"Welcome, {user_data['name']}!",
+                message=self._welcome_message(user_data["name"]),
             )
-        except Exception as e:
-            # Don't fail user creation if notification fails
+        except OSError as e:
+            # Transport errors (including ConnectionError and TimeoutError)
+            # are expected and only logged; callers handle anything else
             logger.warning("Failed to send welcome notification: %s", e)
\ No newline at end of file